@@ -15,6 +15,14 @@ import os
 import json
 import sys
 import re
+import datetime
+import tempfile
+import functools
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from typing import Dict, List, Optional, Tuple, Union
 import getpass
 
@@ -26,6 +34,13 @@ except ImportError:
     import subprocess
     subprocess.check_call([sys.executable, "-m", "pip", "install", "pymysql"])
     import pymysql
+from pymysql.constants import CLIENT
+
+# orjson is optional and only speeds up reading/writing the configuration
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ASCII Art for MYSQLMIGRATOR
 MYSQLMIGRATOR_ASCII = """
@@ -39,6 +54,226 @@ MYSQLMIGRATOR_ASCII = """
 """
 
 CONFIG_FILE = ".migrator-env"
+POOL_SIZE = 8  # Max idle connections kept per (host, user, database)
+# Max connections checked out at once per (host, user, database). No code path
+# waits for a second connection to a database while holding one to it, so any
+# bound is deadlock free; callers beyond it wait for a connection to come back.
+MAX_CONNECTIONS = 16
+MAX_WORKERS = 16  # Max destinations migrated concurrently
+INTROSPECTION_WORKERS = 4  # Connections used to run SHOW CREATE queries in parallel
+FETCH_BATCH_SIZE = 5000  # Rows pulled per round trip when iterating results
+PACKET_BUDGET = 0.8  # Share of max_allowed_packet a multi-row INSERT may use
+# How migrate_data treats rows already in destination tables: replace them all,
+# keep them and add the master's, or insert new rows and update existing ones
+MIGRATE_MODES = ("truncate", "append", "upsert")
+# Data migration tuning, overridable under "migration_options" in the config file
+DEFAULT_MIGRATION_OPTIONS = {
+    "migrate_mode": "truncate",  # One of MIGRATE_MODES
+    "batch_size": 1000,  # Rows read from the source and handed to executemany at once
+    "bulk_row_size": 1000,  # Target rows per multi-row INSERT statement
+    "commit_every": 0,  # Commit after this many batches, 0 commits once per table
+    "workers": 4,  # Tables loaded concurrently per destination
+    "load_data_infile": False,  # Load rows with LOAD DATA LOCAL INFILE instead of INSERT
+    "cache_schema": True,  # Reuse database metadata for the whole session
+    "rebuild_indexes_after_load": False,  # Drop secondary indexes while loading, re-add them after
+    "consistent_snapshot": False  # Read every table from one master snapshot, needs the RELOAD privilege
+}
+# Session settings for the destination connections that load table data: tables
+# are loaded in arbitrary order from a consistent master, so per-row FK checks are
+# wasted work there. Unique checks are only skipped when the table was emptied
+# first; rows appended or upserted next to existing ones could otherwise duplicate
+# a unique key, or miss the ON DUPLICATE KEY branch on a secondary unique index.
+# Schema steps keep the server defaults, so foreign keys added afterwards still
+# validate the rows already present.
+LOAD_SESSION_INIT = "SET SESSION foreign_key_checks = 0, unique_checks = %s"
+LOAD_SESSION_RESET = "SET SESSION foreign_key_checks = 1, unique_checks = 1"
+
+# Patterns used by standardize_collation, compiled once at import
+# Every charset/collation clause in one alternation, so a single scan strips them
+# all. The combined CHARACTER SET ... COLLATE form must come before its prefix.
+_RE_CHARSET_CLAUSE = re.compile(
+    r'CHARACTER\s+SET\s+\w+\s+COLLATE\s+[\w_]+'
+    r'|COLLATE\s+[\w_]+'
+    r'|CHARACTER\s+SET\s+\w+'
+    r'|(?:DEFAULT\s+)?CHARSET\s*=\s*\w+',
+    re.IGNORECASE
+)
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_DOUBLE_COMMA = re.compile(r'\s*,\s*,\s*')
+_RE_VARCHAR_COLUMN = re.compile(r'`(\w+)`\s+varchar\((\d+)\)', re.IGNORECASE)
+_RE_SINGLE_COLUMN_KEY = re.compile(r'(UNIQUE\s+)?KEY\s+`([^`]+)`\s+\(`([^`]+)`\)', re.IGNORECASE)
+
+# Column type checks on lowered type names, one scan instead of four substring tests
+_RE_TEXT_TYPE = re.compile(r'char|text|enum|set')
+_RE_VARCHAR = re.compile(r'varchar\((\d+)\)')
+
+# Patterns used by remove_foreign_keys
+_RE_FOREIGN_KEY = re.compile(
+    r',?\s*CONSTRAINT\s+`[^`]+`\s+FOREIGN\s+KEY\s+\([^)]+\)\s+REFERENCES\s+`[^`]+`\s+\([^)]+\)(?:\s+ON\s+DELETE\s+\w+)?(?:\s+ON\s+UPDATE\s+\w+)?',
+    re.IGNORECASE
+)
+_RE_TRAILING_COMMA = re.compile(r',\s*\)')
+
+# A user WHERE clause that already ends the query, so no ORDER BY may follow it
+_RE_ORDER_OR_LIMIT = re.compile(r'\b(?:ORDER\s+BY|LIMIT)\b', re.IGNORECASE)
+
+log = logging.getLogger("mysqlmigrator")
+
+# Records are written synchronously to stdout, so progress lines stay in order
+# with the menu prompts and importing the migrator is enough to see them
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+log.addHandler(_log_handler)
+log.setLevel(logging.INFO)
+log.propagate = False
+
+def batched_fetch(cursor, size: int = FETCH_BATCH_SIZE):
+    """Yield rows from a cursor, fetching them in batches of size"""
+    while True:
+        chunk = cursor.fetchmany(size)
+        if not chunk:
+            return
+        yield from chunk
+
+def prefetch_batches(cursor, size: int, depth: int = 2):
+    """Yield batches of rows while a background thread fetches the next ones"""
+    # At most depth batches wait in the queue, so memory stays bounded while the
+    # source read overlaps with whatever the consumer does with each batch
+    batches = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+    
+    def produce():
+        try:
+            while not stop.is_set():
+                batch = cursor.fetchmany(size)
+                if not batch:
+                    break
+                batches.put(batch)
+            batches.put(done)
+        except BaseException as e:
+            batches.put(e)  # Re-raised on the consumer side
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = batches.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # The cursor must be idle before its connection is reused: stop the
+        # producer, draining the queue so it can't stay blocked on put
+        stop.set()
+        while producer.is_alive():
+            try:
+                batches.get_nowait()
+            except queue.Empty:
+                pass
+            producer.join(0.05)
+
+def _dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _loads(data: bytes):
+    """Parse JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+def _tsv_field(value) -> bytes:
+    """Encode a value as a LOAD DATA field using the default escaping"""
+    if value is None:
+        return b'\\N'
+    if isinstance(value, (bytes, bytearray)):
+        data = bytes(value)
+    elif isinstance(value, datetime.timedelta):
+        data = pymysql.converters.escape_timedelta(value)[1:-1].encode('ascii')  # Strip quotes
+    else:
+        data = str(value).encode('utf-8')
+    return data.replace(b'\\', b'\\\\').replace(b'\t', b'\\t').replace(b'\n', b'\\n').replace(b'\0', b'\\0')
+
+def execute_script(cursor, statements: List[str]) -> None:
+    """Send statements in one round trip and consume all of their results"""
+    cursor.execute(";\n".join(statements))
+    while cursor.nextset():  # Raises if any later statement failed
+        pass
+
+def _qid(name: str) -> str:
+    """Quote a MySQL identifier, escaping embedded backticks"""
+    return '`' + name.replace('`', '``') + '`'
+
+def _group_indexes(rows) -> Dict[str, Dict[str, Dict]]:
+    """Group information_schema.STATISTICS rows by table and index name"""
+    indexes = {}
+    for row in rows:
+        table_indexes = indexes.setdefault(row['TABLE_NAME'], {})
+        index_info = table_indexes.setdefault(row['INDEX_NAME'], {
+            'columns': [],  # Column names in key order
+            'parts': [],  # (column, prefix length, descending) per key part
+            'unique': not int(row['NON_UNIQUE']),
+            'type': row['INDEX_TYPE'],
+            'comment': row.get('INDEX_COMMENT') or "",
+            'visible': row.get('IS_VISIBLE') != 'NO',  # Only reported by MySQL 8
+            'functional': False
+        })
+        if row['COLUMN_NAME'] is None:
+            index_info['functional'] = True  # An expression key part, it has no column
+            continue
+        index_info['columns'].append(row['COLUMN_NAME'])
+        # Spatial keys report a fixed SUB_PART, but no prefix may be declared for them
+        prefix = row['SUB_PART'] if row['INDEX_TYPE'] != 'SPATIAL' else None
+        index_info['parts'].append((row['COLUMN_NAME'], prefix, row.get('COLLATION') == 'D'))
+    return indexes
+
+def _key_part(column: str, prefix: Optional[int] = None, descending: bool = False) -> str:
+    """Format one key part of an index definition"""
+    return _qid(column) + (f"({prefix})" if prefix else "") + (" DESC" if descending else "")
+
+def _index_clause(index_name: str, index_info: Dict, escape, key_parts: Optional[List[str]] = None) -> str:
+    """Build the ADD clause that recreates an index described by _group_indexes"""
+    if key_parts is None:
+        key_parts = [_key_part(*part) for part in index_info['parts']]
+    index_type = index_info['type']
+    options = ""
+    if index_type in ('FULLTEXT', 'SPATIAL'):
+        kind = f"{index_type} INDEX"
+    else:
+        kind = "UNIQUE INDEX" if index_info['unique'] else "INDEX"
+        if index_type in ('BTREE', 'HASH'):
+            options += f" USING {index_type}"
+    if index_info['comment']:
+        options += f" COMMENT {escape(index_info['comment'])}"
+    if not index_info['visible']:
+        options += " INVISIBLE"
+    return f"ADD {kind} {_qid(index_name)} ({', '.join(key_parts)}){options}"
+
+def memoize_per_config(method):
+    """Cache a metadata lookup per (host, user, database) until invalidated"""
+    @functools.wraps(method)
+    def wrapper(self, config: Dict, *args, **kwargs):
+        if not self.migration_options['cache_schema']:
+            return method(self, config, *args, **kwargs)
+        key = (self._pool_key(config), method.__name__) + args + tuple(sorted(kwargs.items()))
+        with self._cache_lock:
+            key_lock = self._cache_locks.setdefault(key, threading.Lock())
+        # Concurrent callers wait for the first lookup instead of repeating it
+        with key_lock:
+            with self._cache_lock:
+                if key in self._schema_cache:
+                    return self._schema_cache[key]
+            result = method(self, config, *args, **kwargs)
+            if result:  # Failed or empty lookups are retried next time
+                with self._cache_lock:
+                    self._schema_cache[key] = result
+            return result
+    return wrapper
 
 class MySQLMigrator:
     def __init__(self):
@@ -49,16 +284,25 @@ class MySQLMigrator:
             "database": ""
         }
         self.destination_configs = []
+        self.migration_options = dict(DEFAULT_MIGRATION_OPTIONS)
         self.config_loaded = False
+        self._pool: Dict[Tuple[str, str, str, bool], List[pymysql.connections.Connection]] = {}
+        self._pool_lock = threading.Lock()
+        self._slots: Dict[Tuple[str, str, str], threading.BoundedSemaphore] = {}
+        self._snapshot_lock = threading.Lock()
+        self._schema_cache: Dict[tuple, object] = {}
+        self._cache_locks: Dict[tuple, threading.Lock] = {}
+        self._cache_lock = threading.Lock()  # Guards _schema_cache and _cache_locks
         
     def load_config(self) -> bool:
         """Load configuration from .migrator-env file if exists"""
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
+                with open(CONFIG_FILE, 'rb') as f:
+                    config = _loads(f.read())
                     self.master_config = config.get('master_config', {})
                     self.destination_configs = config.get('destination_configs', [])
+                    self.migration_options = {**DEFAULT_MIGRATION_OPTIONS, **config.get('migration_options', {})}
                     self.config_loaded = True
                     return True
             except Exception as e:
@@ -69,12 +313,13 @@ class MySQLMigrator:
     def save_config(self) -> bool:
         """Save configuration to .migrator-env file"""
         try:
-            with open(CONFIG_FILE, 'w') as f:
+            with open(CONFIG_FILE, 'wb') as f:
                 config = {
                     'master_config': self.master_config,
-                    'destination_configs': self.destination_configs
+                    'destination_configs': self.destination_configs,
+                    'migration_options': self.migration_options
                 }
-                json.dump(config, f, indent=2)
+                f.write(_dumps(config))
             return True
         except Exception as e:
             print(f"Error saving configuration: {e}")
@@ -92,7 +337,10 @@ class MySQLMigrator:
                     "database": ""
                 }
                 self.destination_configs = []
+                self.migration_options = dict(DEFAULT_MIGRATION_OPTIONS)
                 self.config_loaded = False
+                self.close_connections()
+                self._invalidate()
                 return True
             except Exception as e:
                 print(f"Error resetting configuration: {e}")
@@ -175,7 +423,7 @@ class MySQLMigrator:
         
         return True
     
-    def get_connection(self, config):
+    def get_connection(self, config, local_infile: bool = False):
         """Get a MySQL connection based on config"""
         return pymysql.connect(
             host=config["host"],
@@ -183,130 +431,263 @@ class MySQLMigrator:
             password=config["password"],
             database=config["database"],
             cursorclass=pymysql.cursors.DictCursor,
-            charset='utf8mb4'
+            charset='utf8mb4',
+            autocommit=False,
+            client_flag=CLIENT.MULTI_STATEMENTS,
+            # Lets the server read any client file it names, so only destination
+            # connections that run LOAD DATA LOCAL enable it
+            local_infile=local_infile
         )
     
-    def get_table_schema(self, config: Dict) -> Dict[str, Dict]:
-        """Get the schema of all tables in a database"""
-        schema = {}
+    def _pool_key(self, config: Dict) -> Tuple[str, str, str]:
+        """Key identifying connections that can be shared for a config"""
+        return (config["host"], config["user"], config["database"])
+    
+    def _discard(self, conn) -> None:
+        """Close a connection, ignoring errors from already broken links"""
         try:
-            conn = self.get_connection(config)
-            cursor = conn.cursor()
-            
-            # Get all tables
+            conn.close()
+        except Exception:
+            pass
+    
+    def _slot(self, key: Tuple[str, str, str]) -> threading.BoundedSemaphore:
+        """Get the semaphore counting checked-out connections for a pool key"""
+        with self._pool_lock:
+            return self._slots.setdefault(key, threading.BoundedSemaphore(MAX_CONNECTIONS))
+    
+    def _acquire(self, config: Dict, local_infile: bool = False):
+        """Take an idle pooled connection for config or open a new one"""
+        key = self._pool_key(config)
+        idle_key = key + (local_infile,)  # Connections with and without LOCAL INFILE aren't interchangeable
+        slot = self._slot(key)
+        slot.acquire()  # Wait while MAX_CONNECTIONS are checked out for this key
+        try:
+            while True:
+                with self._pool_lock:
+                    idle = self._pool.get(idle_key)
+                    if not idle:
+                        break
+                    conn = idle.pop()
+                try:
+                    conn.ping(reconnect=True)
+                    return conn
+                except Exception:
+                    self._discard(conn)
+            return self.get_connection(config, local_infile)
+        except BaseException:
+            slot.release()
+            raise
+    
+    def _release(self, conn, key: Tuple[str, str, str], local_infile: bool = False) -> None:
+        """Return a connection to the pool, closing it if the pool is full"""
+        try:
+            conn.rollback()  # Never hand out a connection with an open transaction
+            with self._pool_lock:
+                idle = self._pool.setdefault(key + (local_infile,), [])
+                if len(idle) < POOL_SIZE:
+                    idle.append(conn)
+                    return
+            self._discard(conn)
+        except Exception:
+            self._discard(conn)
+        finally:
+            self._slot(key).release()
+    
+    @contextmanager
+    def _conn(self, config: Dict, local_infile: bool = False):
+        """Check out a pooled connection for the duration of a with block"""
+        key = self._pool_key(config)
+        conn = self._acquire(config, local_infile)
+        try:
+            yield conn
+        except BaseException:
+            self._discard(conn)  # State is unknown after a failure, don't reuse it
+            self._slot(key).release()
+            raise
+        self._release(conn, key, local_infile)
+    
+    def _invalidate(self, config: Optional[Dict] = None) -> None:
+        """Drop cached metadata for config, or for every database if None"""
+        with self._cache_lock:
+            if config is None:
+                self._schema_cache.clear()
+                return
+            pool_key = self._pool_key(config)
+            for key in [key for key in self._schema_cache if key[0] == pool_key]:
+                del self._schema_cache[key]
+    
+    def close_connections(self) -> None:
+        """Close all idle pooled connections"""
+        with self._pool_lock:
+            idle_conns = [conn for idle in self._pool.values() for conn in idle]
+            self._pool.clear()
+        for conn in idle_conns:
+            self._discard(conn)
+    
+    def list_tables(self, conn) -> List[str]:
+        """Get the table names visible on a connection"""
+        # A tuple cursor gives the name as row[0] without building a dict per row
+        with conn.cursor(pymysql.cursors.Cursor) as cursor:
             cursor.execute("SHOW TABLES;")
-            tables = cursor.fetchall()
+            return [row[0] for row in cursor.fetchall()]
+    
+    def _show_create_all(self, config: Dict, object_type: str, names: List[str], column: str) -> Dict[str, str]:
+        """Run SHOW CREATE for every named object, spread over pooled connections"""
+        def fetch(chunk: List[str]) -> Dict[str, str]:
+            statements = {}
+            with self._conn(config) as conn:
+                cursor = conn.cursor()
+                for name in chunk:
+                    cursor.execute(f"SHOW CREATE {object_type} {_qid(name)};")
+                    result = cursor.fetchone()
+                    if result:
+                        statements[name] = result[column]
+            return statements
+        
+        # Each worker walks its own slice on its own connection, so the round
+        # trips of the different slices overlap instead of queueing
+        chunks = [names[i::INTROSPECTION_WORKERS] for i in range(INTROSPECTION_WORKERS)]
+        statements = {}
+        with ThreadPoolExecutor(max_workers=INTROSPECTION_WORKERS) as executor:
+            for chunk_statements in executor.map(fetch, [chunk for chunk in chunks if chunk]):
+                statements.update(chunk_statements)
+        return statements
+    
+    def _get_table_columns(self, config: Dict) -> Dict[str, List[Dict]]:
+        """Get the columns of every table in one scan, aliased to match DESCRIBE"""
+        table_columns = {}
+        with self._conn(config) as conn:
+            with conn.cursor(pymysql.cursors.SSDictCursor) as stream:
+                stream.execute(
+                    "SELECT TABLE_NAME, COLUMN_NAME AS `Field`, COLUMN_TYPE AS `Type`, "
+                    "IS_NULLABLE AS `Null`, COLUMN_KEY AS `Key`, COLUMN_DEFAULT AS `Default`, "
+                    "EXTRA AS `Extra`, COLLATION_NAME AS `Collation` "
+                    "FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = %s "
+                    "ORDER BY TABLE_NAME, ORDINAL_POSITION;",
+                    (config['database'],)
+                )
+                for column in batched_fetch(stream):
+                    table_columns.setdefault(column['TABLE_NAME'], []).append(column)
+        return table_columns
+    
+    @memoize_per_config
+    def get_table_schema(self, config: Dict, with_create: bool = True) -> Dict[str, Dict]:
+        """Get the schema of all tables in a database, CREATE statements only if with_create"""
+        schema = {}
+        try:
+            with self._conn(config) as conn:
+                cursor = conn.cursor()
+                
+                # Get all tables and their collations in one query
+                cursor.execute(
+                    "SELECT TABLE_NAME, TABLE_COLLATION FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE' ORDER BY TABLE_NAME;",
+                    (config['database'],)
+                )
+                tables = cursor.fetchall()
+            
+            if with_create:
+                # The column scan and the create table statements (the only per-table
+                # query left) use separate connections, so run them side by side
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    columns_future = executor.submit(self._get_table_columns, config)
+                    create_statements = self._show_create_all(
+                        config, "TABLE", [table_row['TABLE_NAME'] for table_row in tables], "Create Table"
+                    )
+                    table_columns = columns_future.result()
+            else:
+                table_columns = self._get_table_columns(config)
             
             for table_row in tables:
-                table_name = list(table_row.values())[0]  # Get the table name from the dict
-                
-                # Get table schema
-                cursor.execute(f"DESCRIBE `{table_name}`;")
-                columns = cursor.fetchall()
-                schema[table_name] = columns
-                
-                # Get create table statement
-                cursor.execute(f"SHOW CREATE TABLE `{table_name}`;")
-                create_table = cursor.fetchone()
-                schema[f"{table_name}_create"] = create_table["Create Table"]
+                table_name = table_row['TABLE_NAME']
+                schema[table_name] = table_columns.get(table_name, [])
+                if with_create:
+                    schema[f"{table_name}_create"] = create_statements[table_name]
                 
-                # Get table collation
-                cursor.execute(f"SELECT TABLE_COLLATION FROM information_schema.TABLES WHERE TABLE_SCHEMA = '{config['database']}' AND TABLE_NAME = '{table_name}';")
-                collation_result = cursor.fetchone()
-                if collation_result:
-                    schema[f"{table_name}_collation"] = collation_result['TABLE_COLLATION']
-                
-            conn.close()
+                if table_row['TABLE_COLLATION']:
+                    schema[f"{table_name}_collation"] = table_row['TABLE_COLLATION']
+            
             return schema
         except Exception as e:
-            print(f"Error getting schema from {config['database']}: {e}")
+            log.error("Error getting schema from %s: %s", config['database'], e)
             return {}
             
-    def get_indexes(self, config: Dict) -> Dict[str, List]:
-        """Get all indexes from a database"""
-        indexes = {}
+    @memoize_per_config
+    def get_indexes(self, config: Dict) -> Dict[str, Dict]:
+        """Get all indexes from a database, grouped by table and index name"""
         try:
-            conn = self.get_connection(config)
-            cursor = conn.cursor()
-            
-            # Get all tables
-            cursor.execute("SHOW TABLES;")
-            tables = cursor.fetchall()
-            
-            for table_row in tables:
-                table_name = list(table_row.values())[0]  # Get the table name from the dict
-                
-                # Get indexes for this table
-                cursor.execute(f"SHOW INDEX FROM `{table_name}`;")
-                table_indexes = cursor.fetchall()
-                
-                if table_indexes:
-                    indexes[table_name] = table_indexes
-            
-            conn.close()
-            return indexes
+            with self._conn(config) as conn:
+                # Get the key parts of every table in one scan. SELECT * because
+                # IS_VISIBLE only exists on MySQL 8.
+                with conn.cursor(pymysql.cursors.SSDictCursor) as stream:
+                    stream.execute(
+                        "SELECT * FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = %s "
+                        "ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX;",
+                        (config['database'],)
+                    )
+                    return _group_indexes(batched_fetch(stream))
         except Exception as e:
-            print(f"Error getting indexes from {config['database']}: {e}")
+            log.error("Error getting indexes from %s: %s", config['database'], e)
             return {}
     
+    @memoize_per_config
     def get_triggers(self, config: Dict) -> Dict[str, Dict]:
         """Get all triggers from a database"""
         triggers = {}
         try:
-            conn = self.get_connection(config)
-            cursor = conn.cursor()
+            with self._conn(config) as conn:
+                cursor = conn.cursor()
+                
+                # Get all triggers
+                cursor.execute("SHOW TRIGGERS;")
+                all_triggers = cursor.fetchall()
             
-            # Get all triggers
-            cursor.execute("SHOW TRIGGERS;")
-            all_triggers = cursor.fetchall()
+            # Get create trigger statements
+            create_statements = self._show_create_all(
+                config, "TRIGGER", [trigger['Trigger'] for trigger in all_triggers], "SQL Original Statement"
+            )
             
             for trigger in all_triggers:
                 trigger_name = trigger['Trigger']
-                
-                # Get create trigger statement
-                cursor.execute(f"SHOW CREATE TRIGGER `{trigger_name}`;")
-                create_trigger = cursor.fetchone()
-                
-                if create_trigger:
+                if trigger_name in create_statements:
                     triggers[trigger_name] = {
                         'info': trigger,
-                        'create_statement': create_trigger['SQL Original Statement']
+                        'create_statement': create_statements[trigger_name]
                     }
             
-            conn.close()
             return triggers
         except Exception as e:
-            print(f"Error getting triggers from {config['database']}: {e}")
+            log.error("Error getting triggers from %s: %s", config['database'], e)
             return {}
     
+    @memoize_per_config
     def get_procedures(self, config: Dict) -> Dict[str, Dict]:
         """Get all stored procedures from a database"""
         procedures = {}
         try:
-            conn = self.get_connection(config)
-            cursor = conn.cursor()
+            with self._conn(config) as conn:
+                cursor = conn.cursor()
+                
+                # Get all procedures
+                cursor.execute("SHOW PROCEDURE STATUS WHERE Db = %s;", (config['database'],))
+                all_procedures = cursor.fetchall()
             
-            # Get all procedures
-            cursor.execute(f"SHOW PROCEDURE STATUS WHERE Db = '{config['database']}';")
-            all_procedures = cursor.fetchall()
+            # Get create procedure statements
+            create_statements = self._show_create_all(
+                config, "PROCEDURE", [proc['Name'] for proc in all_procedures], "Create Procedure"
+            )
             
             for proc in all_procedures:
                 proc_name = proc['Name']
-                
-                # Get create procedure statement
-                cursor.execute(f"SHOW CREATE PROCEDURE `{proc_name}`;")
-                create_proc = cursor.fetchone()
-                
-                if create_proc:
+                if proc_name in create_statements:
                     procedures[proc_name] = {
                         'info': proc,
-                        'create_statement': create_proc['Create Procedure']
+                        'create_statement': create_statements[proc_name]
                     }
             
-            conn.close()
             return procedures
         except Exception as e:
-            print(f"Error getting procedures from {config['database']}: {e}")
+            log.error("Error getting procedures from %s: %s", config['database'], e)
             return {}
     
     def migrate_indexes(self, dest_config: Dict) -> bool:
@@ -315,110 +696,125 @@ class MySQLMigrator:
             # Get indexes from master
             master_indexes = self.get_indexes(self.master_config)
             if not master_indexes:
-                print("No indexes found in master database or error retrieving indexes")
+                log.info("No indexes found in master database or error retrieving indexes")
                 return True  # Not a critical error
             
-            # Connect to destination
-            dest_conn = self.get_connection(dest_config)
-            dest_cursor = dest_conn.cursor()
+            # Columns and existing indexes of every destination table, from two
+            # information_schema scans instead of two SHOW queries per table
+            dest_schema = self.get_table_schema(dest_config, with_create=False)
+            dest_indexes = self.get_indexes(dest_config)
             
-            # Get existing tables in destination
-            dest_cursor.execute("SHOW TABLES;")
-            dest_tables = [list(table.values())[0] for table in dest_cursor.fetchall()]
-            
-            # Get destination database collation
+            # Get destination database collation before taking a connection of our own
             dest_collation = self.get_database_collation(dest_config)
             
-            for table_name, indexes in master_indexes.items():
-                if table_name not in dest_tables:
-                    print(f"Table {table_name} does not exist in destination, skipping indexes")
-                    continue
-                
-                # Get column information to check for text columns
-                dest_cursor.execute(f"SHOW FULL COLUMNS FROM `{table_name}`;")
-                columns_info = {col["Field"]: col for col in dest_cursor.fetchall()}
-                
-                # Drop existing indexes (except primary key)
-                dest_cursor.execute(f"SHOW INDEXES FROM `{table_name}` WHERE Key_name != 'PRIMARY';")
-                existing_indexes = dest_cursor.fetchall()
-                existing_index_names = set()
-                
-                for idx in existing_indexes:
-                    idx_name = idx["Key_name"]
-                    if idx_name not in existing_index_names:
-                        dest_cursor.execute(f"DROP INDEX `{idx_name}` ON `{table_name}`;")
-                        existing_index_names.add(idx_name)
+            # Connect to destination
+            with self._conn(dest_config) as dest_conn:
+                dest_cursor = dest_conn.cursor()
                 
-                # Create indexes from master
-                for index_name, index_info in indexes.items():
-                    if index_name == "PRIMARY":
-                        continue  # Skip primary keys as they're part of table schema
+                for table_name, indexes in master_indexes.items():
+                    columns_info = dest_schema.get(table_name)
+                    if not isinstance(columns_info, list):
+                        log.info("Table %s does not exist in destination, skipping indexes", table_name)
+                        continue
                     
-                    columns = index_info["columns"]
-                    is_unique = index_info["unique"]
+                    table_id = _qid(table_name)
                     
-                    # Check if any column is a text type with utf8mb4 collation
-                    modified_columns = []
-                    for col in columns:
-                        if col in columns_info:
-                            col_type = columns_info[col]["Type"].lower()
-                            collation = columns_info[col]["Collation"]
-                            
-                            # Check if it's a text column with utf8mb4 collation
-                            if collation and "utf8mb4" in collation and any(text_type in col_type for text_type in ["char", "text", "enum", "set"]):
-                                # Limit index length for utf8mb4 text columns
-                                if "varchar" in col_type:
-                                    # Extract size from varchar(X)
-                                    match = re.search(r'varchar\((\d+)\)', col_type)
-                                    if match:
-                                        size = int(match.group(1))
-                                        # If size * 4 > 1000 (max key length), limit it
-                                        if size * 4 > 1000:
-                                            max_chars = min(size, 191)  # 191 * 4 = 764 bytes
-                                            modified_columns.append(f"`{col}`({max_chars})")
-                                            continue
-                                else:  # For text, longtext, etc.
-                                    modified_columns.append(f"`{col}`(191)")
-                                    continue
-                            
-                        modified_columns.append(f"`{col}`")
+                    # Lowered types and collations are computed once per table, not per index column
+                    col_idx = {col["Field"]: i for i, col in enumerate(columns_info)}
+                    col_type_lower = [col["Type"].lower() for col in columns_info]
+                    col_collation = [col["Collation"] or "" for col in columns_info]
                     
-                    columns_str = ", ".join(modified_columns)
-                    unique_str = "UNIQUE" if is_unique else ""
+                    # Existing indexes (except primary key) are replaced by master's. Functional
+                    # indexes can't be rebuilt from STATISTICS, so they are left alone on both sides.
+                    table_dest_indexes = dest_indexes.get(table_name, {})
+                    functional = {
+                        index_name for index_name, index_info in list(indexes.items()) + list(table_dest_indexes.items())
+                        if index_info['functional']
+                    }
+                    existing_index_names = [
+                        index_name for index_name in table_dest_indexes
+                        if index_name != "PRIMARY" and index_name not in functional
+                    ]
+                    
+                    # Build the ADD clause of each master index
+                    index_defs = []
+                    for index_name, index_info in indexes.items():
+                        if index_name == "PRIMARY":
+                            continue  # Skip primary keys as they're part of table schema
+                        if index_name in functional:
+                            log.info("Skipping functional index %s on %s", index_name, table_name)
+                            continue
+                        
+                        key_parts = []
+                        for col, prefix, descending in index_info['parts']:
+                            i = col_idx.get(col)
+                            # Full-text and spatial indexes take no prefix; other keys keep the
+                            # master's, or get one when a utf8mb4 text column could exceed
+                            # the max key length
+                            if not prefix and i is not None and index_info['type'] not in ('FULLTEXT', 'SPATIAL'):
+                                col_type = col_type_lower[i]
+                                if "utf8mb4" in col_collation[i] and _RE_TEXT_TYPE.search(col_type):
+                                    if "varchar" in col_type:
+                                        # Extract size from varchar(X); 191 * 4 = 764 bytes
+                                        match = _RE_VARCHAR.match(col_type)
+                                        if match and int(match.group(1)) * 4 > 1000:
+                                            prefix = 191
+                                    else:  # For text, longtext, etc.
+                                        prefix = 191
+                            key_parts.append(_key_part(col, prefix, descending))
+                        
+                        index_defs.append((index_name, index_info, _index_clause(index_name, index_info, dest_conn.escape, key_parts)))
                     
+                    # Drop and recreate all indexes of the table in one ALTER TABLE round trip
+                    clauses = [f"DROP INDEX {_qid(idx_name)}" for idx_name in existing_index_names]
+                    clauses += [add_clause for _, _, add_clause in index_defs]
+                    if not clauses:
+                        continue
                     try:
-                        create_index_stmt = f"CREATE {unique_str} INDEX `{index_name}` ON `{table_name}` ({columns_str});"
-                        dest_cursor.execute(create_index_stmt)
-                        print(f"Created index {index_name} on {table_name}")
-                    except Exception as idx_e:
-                        print(f"Error creating index {index_name}: {idx_e}")
-                        # If error contains key length issue, try with more aggressive length limitation
-                        if "max key length" in str(idx_e).lower():
-                            print("Attempting with shorter key length...")
-                            modified_columns = []
-                            for col in columns:
-                                if col in columns_info:
-                                    col_type = columns_info[col]["Type"].lower()
-                                    if any(text_type in col_type for text_type in ["char", "text", "enum", "set"]):
-                                        modified_columns.append(f"`{col}`(100)")
-                                    else:
-                                        modified_columns.append(f"`{col}`")
-                                else:
-                                    modified_columns.append(f"`{col}`")
-                            
-                            columns_str = ", ".join(modified_columns)
-                            create_index_stmt = f"CREATE {unique_str} INDEX `{index_name}` ON `{table_name}` ({columns_str});"
-                            try:
-                                dest_cursor.execute(create_index_stmt)
-                                print(f"Created index {index_name} with reduced key length")
-                            except Exception as retry_e:
-                                print(f"Failed to create index even with reduced length: {retry_e}")
-            
-            dest_conn.commit()
-            dest_conn.close()
+                        dest_cursor.execute(f"ALTER TABLE {table_id} {', '.join(clauses)};")
+                        for index_name, _, _ in index_defs:
+                            log.info("Created index %s on %s", index_name, table_name)
+                        continue
+                    except Exception as alter_e:
+                        # ALTER TABLE is atomic, nothing was applied: go one index at a time
+                        log.warning("Batched index update failed on %s, retrying per index: %s", table_name, alter_e)
+                    
+                    # Each index is dropped and re-added in the same ALTER, so one that can't
+                    # be created leaves the destination's index in place
+                    master_index_names = {index_name for index_name, _, _ in index_defs}
+                    for idx_name in existing_index_names:
+                        if idx_name not in master_index_names:
+                            dest_cursor.execute(f"ALTER TABLE {table_id} DROP INDEX {_qid(idx_name)};")
+                    
+                    # Create indexes from master
+                    for index_name, index_info, add_clause in index_defs:
+                        drop_clause = f"DROP INDEX {_qid(index_name)}, " if index_name in existing_index_names else ""
+                        try:
+                            dest_cursor.execute(f"ALTER TABLE {table_id} {drop_clause}{add_clause};")
+                            log.info("Created index %s on %s", index_name, table_name)
+                        except Exception as idx_e:
+                            log.error("Error creating index %s: %s", index_name, idx_e)
+                            # If error contains key length issue, try with more aggressive length limitation
+                            if "max key length" in str(idx_e).lower():
+                                log.info("Attempting with shorter key length...")
+                                key_parts = []
+                                for col, prefix, descending in index_info['parts']:
+                                    i = col_idx.get(col)
+                                    if i is not None and _RE_TEXT_TYPE.search(col_type_lower[i]):
+                                        prefix = 100
+                                    key_parts.append(_key_part(col, prefix, descending))
+                                
+                                add_clause = _index_clause(index_name, index_info, dest_conn.escape, key_parts)
+                                try:
+                                    dest_cursor.execute(f"ALTER TABLE {table_id} {drop_clause}{add_clause};")
+                                    log.info("Created index %s with reduced key length", index_name)
+                                except Exception as retry_e:
+                                    log.error("Failed to create index even with reduced length: %s", retry_e)
+                
+                dest_conn.commit()
             return True
         except Exception as e:
-            print(f"Error migrating indexes to {dest_config['database']}: {e}")
+            log.error("Error migrating indexes to %s: %s", dest_config['database'], e)
             return False
     
     def migrate_triggers(self, dest_config: Dict) -> bool:
@@ -427,34 +823,27 @@ class MySQLMigrator:
             # Get triggers from master
             master_triggers = self.get_triggers(self.master_config)
             if not master_triggers:
-                print("No triggers found in master database or error retrieving triggers.")
+                log.info("No triggers found in master database or error retrieving triggers.")
                 return True  # Not a failure if no triggers exist
             
             # Connect to destination database
-            dest_conn = self.get_connection(dest_config)
-            dest_cursor = dest_conn.cursor()
-            
-            # Get existing triggers in destination
-            dest_cursor.execute("SHOW TRIGGERS;")
-            dest_triggers = {trigger['Trigger']: trigger for trigger in dest_cursor.fetchall()}
-            
-            # Process each trigger
-            for trigger_name, trigger_data in master_triggers.items():
-                # Check if trigger exists in destination
-                if trigger_name in dest_triggers:
-                    # Drop existing trigger
-                    dest_cursor.execute(f"DROP TRIGGER IF EXISTS `{trigger_name}`;")
+            with self._conn(dest_config) as dest_conn:
+                dest_cursor = dest_conn.cursor()
                 
-                # Create trigger
-                create_stmt = trigger_data['create_statement']
-                dest_cursor.execute(create_stmt)
-                print(f"Created trigger {trigger_name} in {dest_config['database']}")
-            
-            dest_conn.commit()
-            dest_conn.close()
+                # Replace every trigger with one multi-statement round trip
+                statements = []
+                for trigger_name, trigger_data in master_triggers.items():
+                    statements.append(f"DROP TRIGGER IF EXISTS {_qid(trigger_name)}")
+                    statements.append(trigger_data['create_statement'])
+                execute_script(dest_cursor, statements)
+                
+                for trigger_name in master_triggers:
+                    log.info("Created trigger %s in %s", trigger_name, dest_config['database'])
+                
+                dest_conn.commit()
             return True
         except Exception as e:
-            print(f"Error migrating triggers to {dest_config['database']}: {e}")
+            log.error("Error migrating triggers to %s: %s", dest_config['database'], e)
             return False
     
     def migrate_procedures(self, dest_config: Dict) -> bool:
@@ -463,371 +852,708 @@ class MySQLMigrator:
             # Get procedures from master
             master_procedures = self.get_procedures(self.master_config)
             if not master_procedures:
-                print("No stored procedures found in master database or error retrieving procedures.")
+                log.info("No stored procedures found in master database or error retrieving procedures.")
                 return True  # Not a failure if no procedures exist
             
             # Connect to destination database
-            dest_conn = self.get_connection(dest_config)
-            dest_cursor = dest_conn.cursor()
-            
-            # Get existing procedures in destination
-            dest_cursor.execute(f"SHOW PROCEDURE STATUS WHERE Db = '{dest_config['database']}';")
-            dest_procedures = {proc['Name']: proc for proc in dest_cursor.fetchall()}
-            
-            # Process each procedure
-            for proc_name, proc_data in master_procedures.items():
-                # Check if procedure exists in destination
-                if proc_name in dest_procedures:
-                    # Drop existing procedure
-                    dest_cursor.execute(f"DROP PROCEDURE IF EXISTS `{proc_name}`;")
+            with self._conn(dest_config) as dest_conn:
+                dest_cursor = dest_conn.cursor()
                 
-                # Create procedure
-                create_stmt = proc_data['create_statement']
-                dest_cursor.execute(create_stmt)
-                print(f"Created procedure {proc_name} in {dest_config['database']}")
-            
-            dest_conn.commit()
-            dest_conn.close()
+                # Replace every procedure with one multi-statement round trip
+                statements = []
+                for proc_name, proc_data in master_procedures.items():
+                    statements.append(f"DROP PROCEDURE IF EXISTS {_qid(proc_name)}")
+                    statements.append(proc_data['create_statement'])
+                execute_script(dest_cursor, statements)
+                
+                for proc_name in master_procedures:
+                    log.info("Created procedure %s in %s", proc_name, dest_config['database'])
+                
+                dest_conn.commit()
             return True
         except Exception as e:
-            print(f"Error migrating procedures to {dest_config['database']}: {e}")
+            log.error("Error migrating procedures to %s: %s", dest_config['database'], e)
             return False
             
+    @memoize_per_config
     def get_database_collation(self, config: Dict) -> str:
         """Get the default collation of the database"""
         try:
-            conn = self.get_connection(config)
-            cursor = conn.cursor()
-            
-            cursor.execute(f"SELECT DEFAULT_COLLATION_NAME FROM information_schema.SCHEMATA WHERE SCHEMA_NAME = '{config['database']}';")
-            result = cursor.fetchone()
-            conn.close()
+            with self._conn(config) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT DEFAULT_COLLATION_NAME FROM information_schema.SCHEMATA WHERE SCHEMA_NAME = %s;",
+                    (config['database'],)
+                )
+                result = cursor.fetchone()
             
             if result:
                 return result['DEFAULT_COLLATION_NAME']
             return 'utf8mb4_unicode_ci'  # Default fallback
         except Exception as e:
-            print(f"Error getting database collation: {e}")
+            log.error("Error getting database collation: %s", e)
             return 'utf8mb4_unicode_ci'  # Default fallback
     
     def standardize_collation(self, create_stmt: str, target_collation: str) -> str:
         """Remove all collation and charset specifications, fix long indexes"""
         
-        print(f"DEBUG - FULL Original CREATE:\n{create_stmt}\n{'='*80}\n")
+        log.debug("FULL Original CREATE:\n%s\n%s\n", create_stmt, '=' * 80)
         
         # Remove all CHARACTER SET and COLLATE specifications
-        create_stmt = re.sub(r'CHARACTER\s+SET\s+\w+\s+COLLATE\s+[\w_]+', '', create_stmt, flags=re.IGNORECASE)
-        create_stmt = re.sub(r'COLLATE\s+[\w_]+', '', create_stmt, flags=re.IGNORECASE)
-        create_stmt = re.sub(r'CHARACTER\s+SET\s+\w+', '', create_stmt, flags=re.IGNORECASE)
-        create_stmt = re.sub(r'(DEFAULT\s+)?CHARSET\s*=\s*\w+', '', create_stmt, flags=re.IGNORECASE)
+        create_stmt = _RE_CHARSET_CLAUSE.sub('', create_stmt)
         
         # Clean up spaces
-        create_stmt = re.sub(r'\s+', ' ', create_stmt)
-        create_stmt = re.sub(r'\s*,\s*,\s*', ', ', create_stmt)
+        create_stmt = _RE_WHITESPACE.sub(' ', create_stmt)
+        # After collapsing whitespace any doubled comma reads ",," or ", ,"
+        if ',,' in create_stmt or ', ,' in create_stmt:
+            create_stmt = _RE_DOUBLE_COMMA.sub(', ', create_stmt)
         
         # Find varchar columns with size >= 191
         varchar_cols = {}
-        for m in re.finditer(r'`(\w+)`\s+varchar\((\d+)\)', create_stmt, re.IGNORECASE):
+        for m in _RE_VARCHAR_COLUMN.finditer(create_stmt):
             col_name = m.group(1)
             size = int(m.group(2))
             if size >= 191:
                 varchar_cols[col_name] = size
         
-        print(f"DEBUG - VARCHAR columns >= 191: {varchar_cols}")
+        log.debug("VARCHAR columns >= 191: %s", varchar_cols)
         
         # Fix UNIQUE KEY - limit to 191 chars for large varchar columns
         def fix_key(match):
             full_match = match.group(0)
-            key_type = match.group(1) if match.lastindex >= 1 else ""
+            key_type = match.group(1) or ""
             key_name = match.group(2) if match.lastindex >= 2 else ""
             col_name = match.group(3) if match.lastindex >= 3 else ""
             
             if col_name in varchar_cols:
                 result = f'{key_type}KEY `{key_name}` (`{col_name}`(191))'
-                print(f"DEBUG - Fixed: {full_match} -> {result}")
+                log.debug("Fixed: %s -> %s", full_match, result)
                 return result
             return full_match
         
-        # Fix both UNIQUE KEY and regular KEY
-        create_stmt = re.sub(r'(UNIQUE\s+)?KEY\s+`([^`]+)`\s+\(`([^`]+)`\)', fix_key, create_stmt, flags=re.IGNORECASE)
+        # Fix both UNIQUE KEY and regular KEY, only needed when a long varchar exists
+        if varchar_cols:
+            create_stmt = _RE_SINGLE_COLUMN_KEY.sub(fix_key, create_stmt)
         
-        print(f"DEBUG - FULL Modified CREATE:\n{create_stmt}\n{'='*80}\n")
+        log.debug("FULL Modified CREATE:\n%s\n%s\n", create_stmt, '=' * 80)
         
         return create_stmt
             
-    def overwrite_schema(self, dest_config: Dict) -> bool:
+    def overwrite_schema(self, dest_config: Dict, master_schema: Optional[Dict] = None) -> bool:
         """Overwrite the schema in destination database with master schema"""
         try:
-            master_schema = self.get_table_schema(self.master_config)
+            if master_schema is None:
+                master_schema = self.get_table_schema(self.master_config)
             if not master_schema:
-                print(f"Could not retrieve schema from master database: {self.master_config['database']}")
+                log.error("Could not retrieve schema from master database: %s", self.master_config['database'])
                 return False
             
             # Get destination database collation
             dest_collation = self.get_database_collation(dest_config)
-            print(f"Destination database collation: {dest_collation}")
+            log.info("Destination database collation: %s", dest_collation)
             
             # Connect to destination database
-            dest_conn = self.get_connection(dest_config)
-            dest_cursor = dest_conn.cursor()
-            
-            # Get existing tables in destination
-            dest_cursor.execute("SHOW TABLES;")
-            dest_tables = [list(table.values())[0] for table in dest_cursor.fetchall()]
-            
-            # Drop existing tables
-            for table in dest_tables:
-                dest_cursor.execute(f"DROP TABLE IF EXISTS `{table}`;")
-            
-            # Create tables from master schema
-            for table_name in master_schema:
-                if table_name.endswith("_create"):  # This is a create table statement
-                    original_table_name = table_name[:-7]  # Remove "_create" suffix
-                    create_stmt = master_schema[table_name]
-                    
-                    # Standardize collation
-                    create_stmt = self.standardize_collation(create_stmt, dest_collation)
-                    
-                    try:
-                        dest_cursor.execute(create_stmt)
-                        print(f"Created table {original_table_name} in {dest_config['database']}")
-                    except Exception as e:
-                        print(f"Error creating table {original_table_name}: {e}")
-                        print("Attempting to create with default utf8mb4_unicode_ci collation...")
-                        create_stmt = self.standardize_collation(create_stmt, 'utf8mb4_unicode_ci')
-                        dest_cursor.execute(create_stmt)
-                        print(f"Created table {original_table_name} with utf8mb4_unicode_ci collation")
-            
-            dest_conn.commit()
-            dest_conn.close()
+            with self._conn(dest_config) as dest_conn:
+                dest_cursor = dest_conn.cursor()
+                
+                # Get existing tables in destination
+                dest_tables = self.list_tables(dest_conn)
+                
+                # Drop existing tables in a single statement
+                if dest_tables:
+                    dest_cursor.execute(f"DROP TABLE IF EXISTS {', '.join(_qid(table) for table in dest_tables)};")
+                
+                # Create tables from master schema
+                for table_name in master_schema:
+                    if table_name.endswith("_create"):  # This is a create table statement
+                        original_table_name = table_name[:-7]  # Remove "_create" suffix
+                        create_stmt = master_schema[table_name]
+                        
+                        # Standardize collation
+                        create_stmt = self.standardize_collation(create_stmt, dest_collation)
+                        
+                        try:
+                            dest_cursor.execute(create_stmt)
+                            log.info("Created table %s in %s", original_table_name, dest_config['database'])
+                        except Exception as e:
+                            log.error("Error creating table %s: %s", original_table_name, e)
+                            log.info("Attempting to create with default utf8mb4_unicode_ci collation...")
+                            create_stmt = self.standardize_collation(create_stmt, 'utf8mb4_unicode_ci')
+                            dest_cursor.execute(create_stmt)
+                            log.info("Created table %s with utf8mb4_unicode_ci collation", original_table_name)
+                
+                dest_conn.commit()
             
             # Migrate indexes, triggers and procedures
-            print("\nMigrating indexes...")
-            self.migrate_indexes(dest_config)
-            
-            print("\nMigrating triggers...")
-            self.migrate_triggers(dest_config)
-            
-            print("\nMigrating stored procedures...")
-            self.migrate_procedures(dest_config)
+            self.migrate_schema_objects(dest_config)
             
             return True
         except Exception as e:
-            print(f"Error overwriting schema in {dest_config['database']}: {e}")
+            log.error("Error overwriting schema in %s: %s", dest_config['database'], e)
             return False
+        finally:
+            self._invalidate(dest_config)  # Destination metadata changed
+    
+    def migrate_schema_objects(self, dest_config: Dict) -> bool:
+        """Migrate indexes, triggers and procedures concurrently once tables exist"""
+        self._invalidate(dest_config)  # Tables were just created or altered
+        log.info("Migrating indexes, triggers and stored procedures...")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.migrate_indexes, dest_config),
+                executor.submit(self.migrate_triggers, dest_config),
+                executor.submit(self.migrate_procedures, dest_config)
+            ]
+        return all(future.result() for future in futures)
+    
+    def run_on_destinations(self, action, description: str, operation: str, *args) -> None:
+        """Run action against every destination concurrently and report each result"""
+        def run_one(dest_config):
+            log.info("%s %s on %s...", description, dest_config['database'], dest_config['host'])
+            return action(dest_config, *args)
+        
+        workers = max(1, min(MAX_WORKERS, len(self.destination_configs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_one, self.destination_configs))
+        
+        for dest_config, success in zip(self.destination_configs, results):
+            if success:
+                print(f"{operation} successful for {dest_config['database']}")
+            else:
+                print(f"{operation} failed for {dest_config['database']}")
+    
     def remove_foreign_keys(self, create_stmt: str) -> Tuple[str, List[str]]:
         """Remove foreign keys from CREATE TABLE and return them separately"""
         foreign_keys = []
         
         # Find all CONSTRAINT ... FOREIGN KEY patterns
-        fk_pattern = r',?\s*CONSTRAINT\s+`[^`]+`\s+FOREIGN\s+KEY\s+\([^)]+\)\s+REFERENCES\s+`[^`]+`\s+\([^)]+\)(?:\s+ON\s+DELETE\s+\w+)?(?:\s+ON\s+UPDATE\s+\w+)?'
-        
-        for match in re.finditer(fk_pattern, create_stmt, re.IGNORECASE):
+        for match in _RE_FOREIGN_KEY.finditer(create_stmt):
             foreign_keys.append(match.group(0).strip().lstrip(',').strip())
         
+        if not foreign_keys:
+            return create_stmt, foreign_keys  # Nothing to strip or clean up
+        
         # Remove foreign keys from statement
-        create_stmt = re.sub(fk_pattern, '', create_stmt, flags=re.IGNORECASE)
+        create_stmt = _RE_FOREIGN_KEY.sub('', create_stmt)
         
         # Clean up trailing commas before closing parenthesis
-        create_stmt = re.sub(r',\s*\)', ')', create_stmt)
+        create_stmt = _RE_TRAILING_COMMA.sub(')', create_stmt)
         
         return create_stmt, foreign_keys
 
     def add_foreign_keys_after(self, dest_config: Dict, table_fks: Dict[str, List[str]]) -> bool:
         """Add foreign keys after all tables are created"""
         try:
-            dest_conn = self.get_connection(dest_config)
-            dest_cursor = dest_conn.cursor()
-            
-            for table_name, fk_list in table_fks.items():
-                for fk in fk_list:
-                    try:
-                        alter_stmt = f"ALTER TABLE `{table_name}` ADD {fk};"
-                        dest_cursor.execute(alter_stmt)
-                        print(f"Added foreign key to {table_name}")
-                    except Exception as e:
-                        print(f"Warning: Could not add foreign key to {table_name}: {e}")
-            
-            dest_conn.commit()
-            dest_conn.close()
+            with self._conn(dest_config) as dest_conn:
+                dest_cursor = dest_conn.cursor()
+                
+                for table_name, fk_list in table_fks.items():
+                    for fk in fk_list:
+                        try:
+                            alter_stmt = f"ALTER TABLE {_qid(table_name)} ADD {fk};"
+                            dest_cursor.execute(alter_stmt)
+                            log.info("Added foreign key to %s", table_name)
+                        except Exception as e:
+                            log.warning("Could not add foreign key to %s: %s", table_name, e)
+                
+                dest_conn.commit()
             return True
         except Exception as e:
-            print(f"Error adding foreign keys: {e}")
+            log.error("Error adding foreign keys: %s", e)
             return False
     
-    def update_schema(self, dest_config: Dict) -> bool:
+    def update_schema(self, dest_config: Dict, master_schema: Optional[Dict] = None) -> bool:
         """Update the schema in destination database with master schema (add missing fields only)"""
         try:
             table_fks = {}  # Dictionary to store foreign keys
             
-            master_schema = self.get_table_schema(self.master_config)
-            dest_schema = self.get_table_schema(dest_config)
+            if master_schema is None:
+                master_schema = self.get_table_schema(self.master_config)
+            dest_schema = self.get_table_schema(dest_config, with_create=False)
             
             if not master_schema:
-                print(f"Could not retrieve schema from master database: {self.master_config['database']}")
+                log.error("Could not retrieve schema from master database: %s", self.master_config['database'])
                 return False
             
             # Get destination database collation
             dest_collation = self.get_database_collation(dest_config)
-            print(f"Destination database collation: {dest_collation}")
+            log.info("Destination database collation: %s", dest_collation)
             
             # Connect to destination database
-            dest_conn = self.get_connection(dest_config)
-            dest_cursor = dest_conn.cursor()
-            
-            # Process each table in master schema
-            for table_name in master_schema:
-                if table_name.endswith("_create") or table_name.endswith("_collation"):
-                    continue  # Skip create statements and collation info for now
+            with self._conn(dest_config) as dest_conn:
+                dest_cursor = dest_conn.cursor()
                 
-                if table_name in dest_schema:
-                    # Table exists, check for missing columns
-                    master_columns = {col["Field"]: col for col in master_schema[table_name]}
-                    dest_columns = {col["Field"]: col for col in dest_schema[table_name]}
+                # Process each table in master schema
+                for table_name in master_schema:
+                    if table_name.endswith("_create") or table_name.endswith("_collation"):
+                        continue  # Skip create statements and collation info for now
                     
-                    for col_name, col_info in master_columns.items():
-                        if col_name not in dest_columns:
-                            # Add missing column
-                            col_type = col_info["Type"]
-                            null_str = "NULL" if col_info["Null"] == "YES" else "NOT NULL"
-                            default_str = f"DEFAULT '{col_info['Default']}'" if col_info['Default'] is not None else ""
-                            
-                            # Add collation for text columns
-                            collation_str = ""
-                            if any(text_type in col_type.lower() for text_type in ["char", "text", "enum", "set"]):
-                                collation_str = f" CHARACTER SET utf8mb4 COLLATE {dest_collation}"
-                            
-                            alter_stmt = f"ALTER TABLE `{table_name}` ADD COLUMN `{col_name}` {col_type}{collation_str} {null_str} {default_str};"
+                    if table_name in dest_schema:
+                        # Table exists, check for missing columns
+                        master_columns = {col["Field"]: col for col in master_schema[table_name]}
+                        dest_fields = {col["Field"] for col in dest_schema[table_name]}
+                        
+                        missing_columns = []
+                        for col_name, col_info in master_columns.items():
+                            if col_name not in dest_fields:
+                                # Add missing column
+                                col_type = col_info["Type"]
+                                null_str = "NULL" if col_info["Null"] == "YES" else "NOT NULL"
+                                default_str = f"DEFAULT '{col_info['Default']}'" if col_info['Default'] is not None else ""
+                                
+                                # Add collation for text columns
+                                collation_str = ""
+                                if _RE_TEXT_TYPE.search(col_type.lower()):
+                                    collation_str = f" CHARACTER SET utf8mb4 COLLATE {dest_collation}"
+                                
+                                missing_columns.append((col_name, col_type, collation_str, null_str, default_str))
+                        
+                        if not missing_columns:
+                            continue
+                        
+                        # Add all missing columns in one ALTER TABLE, a single table rebuild
+                        add_clauses = [
+                            f"ADD COLUMN {_qid(col_name)} {col_type}{collation_str} {null_str} {default_str}"
+                            for col_name, col_type, collation_str, null_str, default_str in missing_columns
+                        ]
+                        try:
+                            dest_cursor.execute(f"ALTER TABLE {_qid(table_name)} {', '.join(add_clauses)};")
+                            for col_name, *_ in missing_columns:
+                                log.info("Added column %s to table %s in %s", col_name, table_name, dest_config['database'])
+                            continue
+                        except Exception as alter_e:
+                            # ALTER TABLE is atomic, nothing was applied: go one column at a time
+                            log.warning("Batched column update failed on %s, retrying per column: %s", table_name, alter_e)
+                        
+                        for col_name, col_type, collation_str, null_str, default_str in missing_columns:
+                            alter_stmt = f"ALTER TABLE {_qid(table_name)} ADD COLUMN {_qid(col_name)} {col_type}{collation_str} {null_str} {default_str};"
                             try:
                                 dest_cursor.execute(alter_stmt)
-                                print(f"Added column {col_name} to table {table_name} in {dest_config['database']}")
+                                log.info("Added column %s to table %s in %s", col_name, table_name, dest_config['database'])
                             except Exception as col_e:
-                                print(f"Error adding column with specified collation: {col_e}")
-                                print("Attempting with utf8mb4_unicode_ci collation...")
+                                log.error("Error adding column with specified collation: %s", col_e)
+                                log.info("Attempting with utf8mb4_unicode_ci collation...")
                                 if collation_str:
                                     collation_str = " CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"
-                                    alter_stmt = f"ALTER TABLE `{table_name}` ADD COLUMN `{col_name}` {col_type}{collation_str} {null_str} {default_str};"
+                                    alter_stmt = f"ALTER TABLE {_qid(table_name)} ADD COLUMN {_qid(col_name)} {col_type}{collation_str} {null_str} {default_str};"
                                     dest_cursor.execute(alter_stmt)
-                                    print(f"Added column {col_name} with utf8mb4_unicode_ci collation")
-                else:
-                    # Table doesn't exist, create it
-                    create_stmt = master_schema[f"{table_name}_create"]
-                    
-                    # Standardize collation
-                    create_stmt = self.standardize_collation(create_stmt, dest_collation)
-                    
-                    # Remove foreign keys temporarily
-                    create_stmt, fk_list = self.remove_foreign_keys(create_stmt)
-                    if fk_list:
-                        table_fks[table_name] = fk_list
-                    
-                    try:
-                        dest_cursor.execute(create_stmt)
-                        print(f"Created table {table_name} in {dest_config['database']}")
-                    except Exception as e:
-                        print(f"Error creating table {table_name}: {e}")
-                        print("Attempting to create with default utf8mb4_unicode_ci collation...")
-                        create_stmt_original = master_schema[f"{table_name}_create"]
-                        create_stmt = self.standardize_collation(create_stmt_original, 'utf8mb4_unicode_ci')
+                                    log.info("Added column %s with utf8mb4_unicode_ci collation", col_name)
+                    else:
+                        # Table doesn't exist, create it
+                        create_stmt = master_schema[f"{table_name}_create"]
+                        
+                        # Standardize collation
+                        create_stmt = self.standardize_collation(create_stmt, dest_collation)
+                        
+                        # Remove foreign keys temporarily
                         create_stmt, fk_list = self.remove_foreign_keys(create_stmt)
                         if fk_list:
                             table_fks[table_name] = fk_list
-                        dest_cursor.execute(create_stmt)
-                        print(f"Created table {table_name} with utf8mb4_unicode_ci collation")
-            
-            dest_conn.commit()
-            dest_conn.close()
+                        
+                        try:
+                            dest_cursor.execute(create_stmt)
+                            log.info("Created table %s in %s", table_name, dest_config['database'])
+                        except Exception as e:
+                            log.error("Error creating table %s: %s", table_name, e)
+                            log.info("Attempting to create with default utf8mb4_unicode_ci collation...")
+                            create_stmt_original = master_schema[f"{table_name}_create"]
+                            create_stmt = self.standardize_collation(create_stmt_original, 'utf8mb4_unicode_ci')
+                            create_stmt, fk_list = self.remove_foreign_keys(create_stmt)
+                            if fk_list:
+                                table_fks[table_name] = fk_list
+                            dest_cursor.execute(create_stmt)
+                            log.info("Created table %s with utf8mb4_unicode_ci collation", table_name)
+                
+                dest_conn.commit()
             
             # Add foreign keys after all tables are created
             if table_fks:
-                print("\nAdding foreign keys...")
+                log.info("Adding foreign keys...")
                 self.add_foreign_keys_after(dest_config, table_fks)
             
             # Migrate indexes, triggers and procedures
-            print("\nMigrating indexes...")
-            self.migrate_indexes(dest_config)
-            
-            print("\nMigrating triggers...")
-            self.migrate_triggers(dest_config)
-            
-            print("\nMigrating stored procedures...")
-            self.migrate_procedures(dest_config)
+            self.migrate_schema_objects(dest_config)
             
             return True
         except Exception as e:
-            print(f"Error updating schema in {dest_config['database']}: {e}")
+            log.error("Error updating schema in %s: %s", dest_config['database'], e)
             return False
+        finally:
+            self._invalidate(dest_config)  # Destination metadata changed
     
-    def migrate_data(self, dest_config: Dict, where_clause: str = "") -> bool:
-        """Migrate data from master to destination database"""
+    @memoize_per_config
+    def get_packet_budget(self, config: Dict) -> int:
+        """Get the largest statement size to send, a share of max_allowed_packet"""
+        with self._conn(config) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT @@max_allowed_packet AS max_packet;")
+            return int(cursor.fetchone()['max_packet'] * PACKET_BUDGET)
+    
+    def _drop_secondary_indexes(self, cursor, table_name: str) -> List[str]:
+        """Drop the non-primary indexes of a table and return the clauses that re-add them"""
+        # Read fresh, the cached get_indexes may predate an earlier load of this table
+        cursor.execute(
+            "SELECT * FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE() "
+            "AND TABLE_NAME = %s AND INDEX_NAME != 'PRIMARY' ORDER BY INDEX_NAME, SEQ_IN_INDEX;",
+            (table_name,)
+        )
+        indexes = {}
+        for table_indexes in _group_indexes(cursor.fetchall()).values():
+            indexes.update(table_indexes)
+        if any(index_info['functional'] for index_info in indexes.values()):
+            return []  # Functional indexes can't be rebuilt from STATISTICS, keep them all
+        
+        add_clauses = [
+            _index_clause(index_name, index_info, cursor.connection.escape)
+            for index_name, index_info in indexes.items()
+        ]
+        if add_clauses:
+            cursor.execute(f"ALTER TABLE {_qid(table_name)} {', '.join(f'DROP INDEX {_qid(name)}' for name in indexes)};")
+        return add_clauses
+    
+    def _start_table_load(self, dest_conn, table_name: str, truncate: bool, rebuild_indexes: bool) -> List[str]:
+        """Prepare a destination table for loading and open its transaction"""
+        table_id = _qid(table_name)
+        cursor = dest_conn.cursor()
+        index_clauses = []
+        delete_rows = False
+        if truncate:
+            # Clear existing data in destination table. TRUNCATE skips per-row undo
+            # and triggers; the load session has foreign_key_checks off, so
+            # referenced tables can be truncated too.
+            try:
+                cursor.execute(f"TRUNCATE TABLE {table_id}")
+            except Exception as truncate_e:
+                log.warning("Could not truncate %s, deleting rows instead: %s", table_name, truncate_e)
+                delete_rows = True
+            
+            # Building indexes once after the load beats updating them per row
+            if rebuild_indexes:
+                try:
+                    index_clauses = self._drop_secondary_indexes(cursor, table_name)
+                except Exception as drop_e:
+                    log.warning("Keeping indexes of %s during load: %s", table_name, drop_e)
+        
+        # Load the whole table in one explicit transaction. TRUNCATE and the index
+        # drop are DDL and commit implicitly, so they run before it; a DELETE runs
+        # inside it and is only committed together with the new rows.
+        dest_conn.begin()
+        if delete_rows:
+            cursor.execute(f"DELETE FROM {table_id}")
+        return index_clauses
+    
+    @contextmanager
+    def _load_session(self, dest_conn, unique_checks: bool):
+        """Turn off per-row checks on a destination connection for one table load"""
+        with dest_conn.cursor() as cursor:
+            cursor.execute(LOAD_SESSION_INIT, (int(unique_checks),))
+        yield
+        # Restore the defaults before the connection goes back to the pool; after a
+        # failure _conn discards the connection instead
+        with dest_conn.cursor() as cursor:
+            cursor.execute(LOAD_SESSION_RESET)
+    
+    @contextmanager
+    def _master_snapshot(self, count: int):
+        """Open count master connections that all read from one snapshot and queue them"""
+        key = self._pool_key(self.master_config)
+        # One destination at a time holds snapshot connections, so taking them can't
+        # starve another destination halfway and a metadata lookup always finds a
+        # free master connection
+        with self._snapshot_lock:
+            conns = []
+            try:
+                for _ in range(count):
+                    conns.append(self._acquire(self.master_config))
+                # Writes on the master are blocked only until every snapshot is open
+                lock_cursor = conns[0].cursor()
+                lock_cursor.execute("FLUSH TABLES WITH READ LOCK")
+                try:
+                    for conn in conns:
+                        execute_script(conn.cursor(), [
+                            "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ",
+                            "START TRANSACTION WITH CONSISTENT SNAPSHOT"
+                        ])
+                finally:
+                    lock_cursor.execute("UNLOCK TABLES")
+                snapshot = queue.Queue()
+                for conn in conns:
+                    snapshot.put(conn)
+                yield snapshot
+            except BaseException:
+                for conn in conns:
+                    self._discard(conn)
+                    self._slot(key).release()
+                raise
+            for conn in conns:
+                self._release(conn, key)  # The rollback ends the read transaction
+    
+    @contextmanager
+    def _master_conn(self, snapshot: Optional[queue.Queue]):
+        """Check out a master connection, from the shared snapshot if there is one"""
+        if snapshot is None:
+            with self._conn(self.master_config) as conn:
+                yield conn
+            return
+        conn = snapshot.get()
+        if conn is None:
+            snapshot.put(None)  # Pass the marker on to the next table
+            raise RuntimeError("A master snapshot connection failed, the snapshot is incomplete")
         try:
-            master_schema = self.get_table_schema(self.master_config)
-            dest_schema = self.get_table_schema(dest_config)
+            yield conn
+        except BaseException:
+            snapshot.put(None)  # Its state is unknown and a new one can't join the snapshot
+            raise
+        snapshot.put(conn)
+    
+    @memoize_per_config
+    def get_local_infile(self, config: Dict) -> bool:
+        """Check whether the server accepts LOAD DATA LOCAL INFILE"""
+        with self._conn(config) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT @@local_infile AS local_infile;")
+            return bool(cursor.fetchone()['local_infile'])
+    
+    def _use_load_data(self, dest_config: Dict) -> bool:
+        """Decide whether a destination's tables are loaded with LOAD DATA LOCAL INFILE"""
+        # Upserts need INSERT ... ON DUPLICATE KEY UPDATE
+        if not self.migration_options['load_data_infile'] or self.migration_options['migrate_mode'] == 'upsert':
+            return False
+        # Checked before any table is emptied, a refused LOAD DATA can't undo a TRUNCATE
+        if not self.get_local_infile(dest_config):
+            log.warning("local_infile is disabled on %s, loading rows with INSERT instead", dest_config['database'])
+            return False
+        return True
+    
+    def migrate_table(self, dest_config: Dict, table_name: str, common_columns: List[str], where_clause: str = "",
+                      snapshot: Optional[queue.Queue] = None, load_data_infile: Optional[bool] = None,
+                      packet_budget: Optional[int] = None, master_indexes: Optional[Dict] = None,
+                      dest_indexes: Optional[Dict] = None) -> int:
+        """Copy one table's rows from master to destination and return the row count"""
+        migrate_mode = self.migration_options['migrate_mode']
+        if migrate_mode not in MIGRATE_MODES:
+            raise ValueError(f"Unknown migrate_mode {migrate_mode!r}, expected one of {', '.join(MIGRATE_MODES)}")
+        batch_size = self.migration_options['batch_size']
+        bulk_row_size = self.migration_options['bulk_row_size']
+        commit_every = self.migration_options['commit_every']
+        if load_data_infile is None:
+            load_data_infile = self._use_load_data(dest_config)
+        # Dropping indexes only pays off on a table that starts out empty
+        rebuild_indexes = self.migration_options['rebuild_indexes_after_load'] and migrate_mode == 'truncate'
+        
+        # executemany already folds each batch into multi-row INSERT statements,
+        # split at max_stmt_length bytes, which must stay under the packet limit
+        if packet_budget is None:
+            packet_budget = self.get_packet_budget(dest_config)
+        
+        table_id = _qid(table_name)
+        columns_str = ", ".join(_qid(col) for col in common_columns)
+        
+        # Construct query with optional WHERE clause
+        query = f"SELECT {columns_str} FROM {table_id}"
+        if where_clause:
+            query += f" WHERE {where_clause}"
+        
+        # Rows read in primary key order are appended to the destination's clustered
+        # index instead of splitting its pages; InnoDB stores the master table in that
+        # order, so the scan needs no sort. A WHERE clause that brings its own
+        # ORDER BY or LIMIT keeps them, since nothing can be appended after those.
+        order_str = ""
+        if master_indexes is None:
+            master_indexes = self.get_indexes(self.master_config)
+        master_primary_key = master_indexes.get(table_name, {}).get('PRIMARY')
+        if master_primary_key and not _RE_ORDER_OR_LIMIT.search(where_clause):
+            order_str = " ORDER BY " + ", ".join(_qid(col) for col in master_primary_key['columns'])
+        query += order_str
+        
+        insert_verb = "INSERT"
+        insert_suffix = ""
+        if migrate_mode == 'upsert':
+            # Rows whose key already exists get their other columns overwritten
+            if dest_indexes is None:
+                dest_indexes = self.get_indexes(dest_config)
+            primary_key = dest_indexes.get(table_name, {}).get('PRIMARY', {})
+            key_columns = set(primary_key.get('columns', []))
+            update_columns = [col for col in common_columns if col not in key_columns]
+            if update_columns:
+                insert_suffix = " ON DUPLICATE KEY UPDATE " + ", ".join(
+                    f"{_qid(col)} = VALUES({_qid(col)})" for col in update_columns
+                )
+            else:
+                insert_verb = "INSERT IGNORE"  # Every column is part of the key, nothing to update
+        
+        # The insert statement only depends on the table, build it once
+        placeholders = ", ".join(["%s"] * len(common_columns))
+        insert_query = f"{insert_verb} INTO {table_id} ({columns_str}) VALUES ({placeholders}){insert_suffix}"
+        
+        # Master and destination on one server: rows can be copied with a single
+        # INSERT ... SELECT that never leaves it, unless rows must come from the snapshot
+        same_server = (
+            snapshot is None
+            and dest_config['host'] == self.master_config['host']
+            and dest_config.get('port', 3306) == self.master_config.get('port', 3306)
+            and dest_config['database'] != self.master_config['database']
+        )
+        server_query = f"SELECT {columns_str} FROM {_qid(self.master_config['database'])}.{table_id}"
+        if where_clause:
+            server_query += f" WHERE {where_clause}"
+        server_query += order_str
+        
+        # Each table runs on its own pair of connections, they aren't thread-safe
+        with self._master_conn(snapshot) as master_conn, self._conn(dest_config, load_data_infile) as dest_conn, \
+                self._load_session(dest_conn, unique_checks=migrate_mode != 'truncate'):
+            # Tuple rows come back in SELECT order, which is already common_columns
+            # order, so they can go to executemany without per-row repacking.
+            # The unbuffered cursor streams them, so only one batch is held in memory.
+            master_cursor = master_conn.cursor(pymysql.cursors.SSCursor)
+            dest_cursor = dest_conn.cursor()
+            
+            in_server = False
+            if same_server:
+                # Also checks that the destination user may read the master database
+                try:
+                    dest_cursor.execute(f"SELECT 1 FROM ({server_query}) AS probe LIMIT 1;")
+                    if dest_cursor.fetchone() is None:
+                        return 0  # Nothing to copy, leave the destination table as it is
+                    in_server = True
+                except Exception as probe_e:
+                    log.info("Copying %s through the client, master not readable from destination: %s", table_name, probe_e)
+            
+            if not in_server:
+                master_cursor.execute(query)
+            batches = prefetch_batches(master_cursor, batch_size)
             
-            master_conn = self.get_connection(self.master_config)
-            master_cursor = master_conn.cursor()
+            # With load_data_infile, rows are spooled to a local file and sent with
+            # one LOAD DATA statement, which skips per-statement SQL parsing
+            tsv_file = None
+            if load_data_infile and not in_server:
+                tsv_file = tempfile.NamedTemporaryFile(prefix='mysqlmigrator-', suffix='.tsv', delete=False)
             
-            dest_conn = self.get_connection(dest_config)
-            dest_cursor = dest_conn.cursor()
+            index_clauses = []  # Secondary indexes to re-add once the table is loaded
+            try:
+                total_rows = 0
+                if in_server:
+                    index_clauses = self._start_table_load(dest_conn, table_name, migrate_mode == 'truncate', rebuild_indexes)
+                    dest_cursor.execute(f"{insert_verb} INTO {table_id} ({columns_str}) {server_query}{insert_suffix};")
+                    total_rows = dest_cursor.rowcount
+                else:
+                    # Insert data in batches as they arrive from the source, the next
+                    # batch is read while the current one is being written
+                    pending_batches = 0
+                    for batch in batches:
+                        if tsv_file is not None:
+                            tsv_file.write(b"".join(b"\t".join(map(_tsv_field, row)) + b"\n" for row in batch))
+                        else:
+                            if not total_rows:
+                                # Clear and prepare the destination only once rows exist
+                                index_clauses = self._start_table_load(dest_conn, table_name, migrate_mode == 'truncate', rebuild_indexes)
+                                
+                                # Size statements for about bulk_row_size rows, judged from the
+                                # first row with quotes and separators counted
+                                est_row_bytes = sum(len(str(value)) + 3 for value in batch[0]) + 3
+                                dest_cursor.max_stmt_length = min(packet_budget, est_row_bytes * bulk_row_size)
+                            
+                            # Execute the batch insert
+                            dest_cursor.executemany(insert_query, batch)
+                        total_rows += len(batch)
+                        
+                        # Optionally commit as we go to keep transactions short
+                        pending_batches += 1
+                        if commit_every and pending_batches >= commit_every:
+                            dest_conn.commit()
+                            pending_batches = 0
+                    
+                    if tsv_file is not None and total_rows:
+                        tsv_file.close()
+                        # The table is only cleared once every row is spooled, so it isn't
+                        # left empty while the file is written
+                        index_clauses = self._start_table_load(dest_conn, table_name, migrate_mode == 'truncate', rebuild_indexes)
+                        dest_cursor.execute(
+                            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table_id} CHARACTER SET utf8mb4 "
+                            f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({columns_str})",
+                            (tsv_file.name,)
+                        )
+                        # LOAD DATA LOCAL implies IGNORE: duplicate keys are skipped and
+                        # conversion errors become warnings instead of failing the load
+                        warnings = dest_conn.show_warnings()
+                        if dest_cursor.rowcount != total_rows or warnings:
+                            raise RuntimeError(
+                                f"LOAD DATA into {table_name} loaded {dest_cursor.rowcount} of {total_rows} rows "
+                                f"with {len(warnings)} warnings" + (f", first: {warnings[0][2]}" if warnings else "")
+                            )
+                
+                if total_rows:
+                    dest_conn.commit()  # One redo log flush per table
+                    log.info("Migrated %d rows to table %s in %s", total_rows, table_name, dest_config['database'])
+            finally:
+                batches.close()  # Stops the reader thread if the load ended early
+                if tsv_file is not None:
+                    tsv_file.close()
+                    os.remove(tsv_file.name)
+                if index_clauses:
+                    # Restore the indexes even if the load failed, without committing its rows
+                    dest_conn.rollback()
+                    dest_cursor.execute(f"ALTER TABLE {table_id} {', '.join(index_clauses)};")
+                    log.info("Rebuilt %d indexes on table %s in %s", len(index_clauses), table_name, dest_config['database'])
+            
+        return total_rows
+    
+    def migrate_data(self, dest_config: Dict, where_clause: str = "", master_schema: Optional[Dict] = None) -> bool:
+        """Migrate data from master to destination database"""
+        try:
+            if master_schema is None:
+                master_schema = self.get_table_schema(self.master_config, with_create=False)
+            dest_schema = self.get_table_schema(dest_config, with_create=False)
             
-            # Process each table in master schema
+            # Collect the tables to copy and the columns both sides share
+            tables = []
             for table_name in master_schema:
-                if table_name.endswith("_create"):
-                    continue  # Skip create statements
+                if table_name.endswith("_create") or table_name.endswith("_collation"):
+                    continue  # Skip create statements and collation info
                     
                 if table_name not in dest_schema:
-                    print(f"Table {table_name} does not exist in destination database. Skipping data migration.")
+                    log.info("Table %s does not exist in destination database. Skipping data migration.", table_name)
                     continue
                 
-                # Get column names that exist in both databases
-                master_columns = {col["Field"]: col for col in master_schema[table_name]}
-                dest_columns = {col["Field"]: col for col in dest_schema[table_name]}
-                
-                common_columns = [col for col in master_columns if col in dest_columns]
+                # Get column names that exist in both databases, in master order
+                dest_fields = {col["Field"] for col in dest_schema[table_name]}
+                common_columns = [col["Field"] for col in master_schema[table_name] if col["Field"] in dest_fields]
                 if not common_columns:
-                    print(f"No common columns found for table {table_name}. Skipping.")
+                    log.info("No common columns found for table %s. Skipping.", table_name)
                     continue
                 
-                columns_str = ", ".join([f"`{col}`" for col in common_columns])
-                
-                # Construct query with optional WHERE clause
-                query = f"SELECT {columns_str} FROM `{table_name}`"
-                if where_clause:
-                    query += f" WHERE {where_clause}"
-                
-                master_cursor.execute(query)
-                rows = master_cursor.fetchall()
-                
-                if rows:
-                    # Clear existing data in destination table
-                    dest_cursor.execute(f"DELETE FROM `{table_name}`")
-                    
-                    # Insert data in batches
-                    batch_size = 1000
-                    for i in range(0, len(rows), batch_size):
-                        batch = rows[i:i+batch_size]
-                        
-                        # Prepare the placeholders and values for the insert
-                        placeholders = ", ".join(["%s"] * len(common_columns))
-                        insert_query = f"INSERT INTO `{table_name}` ({columns_str}) VALUES ({placeholders})"
-                        
-                        # Extract values from each row
-                        values = []
-                        for row in batch:
-                            row_values = [row[col] for col in common_columns]
-                            values.append(row_values)
-                        
-                        # Execute the batch insert
-                        dest_cursor.executemany(insert_query, values)
-                        
-                    print(f"Migrated {len(rows)} rows to table {table_name} in {dest_config['database']}")
+                tables.append((table_name, common_columns))
+            
+            # Settings and key lookups shared by every table, resolved once per
+            # destination instead of once per table
+            table_options = {
+                'load_data_infile': self._use_load_data(dest_config),
+                'packet_budget': self.get_packet_budget(dest_config),
+                'master_indexes': self.get_indexes(self.master_config),
+                'dest_indexes': self.get_indexes(dest_config) if self.migration_options['migrate_mode'] == 'upsert' else None
+            }
             
-            dest_conn.commit()
-            master_conn.close()
-            dest_conn.close()
+            # Tables are independent (foreign_key_checks is off), so load several at once
+            workers = max(1, min(self.migration_options['workers'], len(tables)))
+            with ExitStack() as stack:
+                snapshot = None
+                if self.migration_options['consistent_snapshot'] and tables:
+                    # Every table is read as of the same moment on the master; one
+                    # master connection stays free for metadata lookups
+                    workers = min(workers, MAX_CONNECTIONS - 1)
+                    snapshot = stack.enter_context(self._master_snapshot(workers))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(
+                            self.migrate_table, dest_config, table_name, common_columns, where_clause, snapshot, **table_options
+                        )
+                        for table_name, common_columns in tables
+                    ]
+                for future in futures:
+                    future.result()  # Re-raise the first table failure
             return True
         except Exception as e:
-            print(f"Error migrating data to {dest_config['database']}: {e}")
+            log.error("Error migrating data to %s: %s", dest_config['database'], e)
             return False
     
     def run(self):
@@ -858,30 +1584,19 @@ class MySQLMigrator:
             
             choice = input("\nEnter your choice (1-5): ")
             
+            # The master schema is read once here and shared by every destination
             if choice == '1':
-                for dest_config in self.destination_configs:
-                    print(f"\nOverwriting schema in {dest_config['database']} on {dest_config['host']}...")
-                    if self.overwrite_schema(dest_config):
-                        print(f"Schema overwrite successful for {dest_config['database']}")
-                    else:
-                        print(f"Schema overwrite failed for {dest_config['database']}")
+                master_schema = self.get_table_schema(self.master_config)
+                self.run_on_destinations(self.overwrite_schema, "Overwriting schema in", "Schema overwrite", master_schema)
             
             elif choice == '2':
-                for dest_config in self.destination_configs:
-                    print(f"\nUpdating schema in {dest_config['database']} on {dest_config['host']}...")
-                    if self.update_schema(dest_config):
-                        print(f"Schema update successful for {dest_config['database']}")
-                    else:
-                        print(f"Schema update failed for {dest_config['database']}")
+                master_schema = self.get_table_schema(self.master_config)
+                self.run_on_destinations(self.update_schema, "Updating schema in", "Schema update", master_schema)
             
             elif choice == '3':
                 where_clause = input("\nEnter optional WHERE clause for data migration (leave empty for all data): ")
-                for dest_config in self.destination_configs:
-                    print(f"\nMigrating data to {dest_config['database']} on {dest_config['host']}...")
-                    if self.migrate_data(dest_config, where_clause):
-                        print(f"Data migration successful for {dest_config['database']}")
-                    else:
-                        print(f"Data migration failed for {dest_config['database']}")
+                master_schema = self.get_table_schema(self.master_config, with_create=False)
+                self.run_on_destinations(self.migrate_data, "Migrating data to", "Data migration", where_clause, master_schema)
             
             elif choice == '4':
                 confirm = input("Are you sure you want to reset configuration? (y/n): ").lower()
@@ -895,6 +1610,7 @@ class MySQLMigrator:
                         print("Configuration reset failed.")
             
             elif choice == '5':
+                self.close_connections()
                 print("Thank you for using MYSQLMIGRATOR. Goodbye!")
                 break
             